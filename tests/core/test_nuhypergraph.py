@@ -0,0 +1,48 @@
+import pytest
+
+import xgi
+
+
+def test_constructor():
+    H = xgi.Hypergraph([[0, 1], [0, 1, 2], [1, 2, 3, 4]])
+    nuH = xgi.nuHypergraph(H)
+
+    assert nuH.num_nodes == 5
+    assert set(nuH.ds) == {(0, 1), (0, 1, 2), (1, 2, 3, 4)}
+    assert all(w == 1 for w in nuH.ds.values())
+
+
+def test_canonical_edge_order():
+    # {8, 16} and {16, 8} iterate in different orders; both must collapse
+    # onto the same sorted key
+    H = xgi.Hypergraph([[8, 16], [16, 8]])
+    nuH = xgi.nuHypergraph(H)
+
+    assert set(nuH.ds) == {(8, 16)}
+
+
+def test_uniformize():
+    H = xgi.Hypergraph([[0, 1], [0, 1, 2], [1, 2, 3, 4]])
+    nuH = xgi.nuHypergraph(H)
+    nuH.uniformize(m=3)
+
+    # node 5 is the auxiliary node padding the edges shorter than m
+    assert nuH.num_nodes == 6
+    assert nuH.nodes == set(range(6))
+
+    ds = nuH.ds
+    assert ds[(0, 1, 5)] == pytest.approx(1 / 3)
+    assert ds[(0, 1, 2)] == pytest.approx(1)
+    for comb in [(1, 2, 3), (1, 2, 4), (1, 3, 4), (2, 3, 4)]:
+        assert ds[comb] == pytest.approx(1 / 24)
+    assert len(ds) == 6
+
+
+def test_uniformize_already_uniform():
+    H = xgi.Hypergraph([[0, 1, 2], [1, 2, 3]])
+    nuH = xgi.nuHypergraph(H)
+    nuH.uniformize(m=3)
+
+    # no padding needed, no auxiliary node added
+    assert nuH.num_nodes == 4
+    assert nuH.ds == {(0, 1, 2): 1.0, (1, 2, 3): 1.0}
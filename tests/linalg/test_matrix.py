@@ -99,6 +99,9 @@ def test_incidence_matrix(edgelist1, edgelist3, edgelist4):
     I7 = xgi.incidence_matrix(H7, order=None, sparse=False)
     assert np.all(I7_sparse == I7)
 
+    # the disconnected node contributes an empty row, not explicit zeros
+    assert I7_sparse.nnz == sum(len(e) for e in el1)
+
     I7_sparse_1 = xgi.incidence_matrix(H7, order=1, sparse=True)
     I7_1 = xgi.incidence_matrix(H7, order=1, sparse=False)
     assert np.all(I7_sparse_1 == I7_1)
@@ -108,6 +111,23 @@ def test_incidence_matrix(edgelist1, edgelist3, edgelist4):
     assert np.all(I7_sparse_2 == I7_2)
 
 
+def test_incidence_matrix_vectorized_weight(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+
+    I1 = xgi.incidence_matrix(H, weight=lambda node, edge, H: 3)
+    I2 = xgi.incidence_matrix(
+        H, vectorized_weight=lambda nodes, edges, H: np.full(len(nodes), 3)
+    )
+    assert (I1 != I2).nnz == 0
+
+    # entries can depend on the node and edge IDs of each incidence
+    I3 = xgi.incidence_matrix(H, weight=lambda node, edge, H: node + edge)
+    I4 = xgi.incidence_matrix(
+        H, vectorized_weight=lambda nodes, edges, H: nodes + edges
+    )
+    assert (I3 != I4).nnz == 0
+
+
 def test_degree_matrix(edgelist1):
     el1 = edgelist1
     H1 = xgi.Hypergraph(el1)
@@ -125,8 +125,10 @@ def to_bipartite_graph(H, index=False):
     edge_dict = dict(zip(H.edges, range(n, n + m)))
     G.add_nodes_from(node_dict.values(), bipartite=0)
     G.add_nodes_from(edge_dict.values(), bipartite=1)
-    for node in H.nodes:
-        for edge in H.nodes.memberships(node):
+    # one pass over the edges touches every membership without a
+    # memberships() view lookup per node
+    for edge, members in H.edges.members(dtype=dict).items():
+        for node in members:
             G.add_edge(node_dict[node], edge_dict[edge])
 
     if index:
@@ -58,11 +58,10 @@ class nuHypergraph(Hypergraph):
 
         self._num_nodes = len(uh.nodes)
         self._nodes = set(uh.nodes)
-        self._ds = {tuple(k): 1 for k in uh.edges.members()}
-    @property
-    def nodes(self):
-        """A :class:`NodeView` of this network."""
-        return self._nodeview
+        self._nodes_arr = np.fromiter(uh.nodes, dtype=np.int32, count=self._num_nodes)
+        # hyperedges are stored in sorted order so that equal node sets map
+        # to the same key regardless of set iteration order
+        self._set_ds({tuple(sorted(k)): 1.0 for k in uh.edges.members()})
 
     @property
     def edges(self):
@@ -71,47 +70,128 @@ class nuHypergraph(Hypergraph):
     
     @property
     def ds(self):
-        return self._ds
-    
+        """The hyperedges and their weights as a dict keyed by node tuples.
+
+        The hyperedges are stored internally as a flat node array with
+        offsets (CSR-style) plus a parallel weight array; this property
+        materializes the dict view of that storage.
+        """
+        return {
+            tuple(
+                self._edges_flat[self._edges_ptr[i] : self._edges_ptr[i + 1]].tolist()
+            ): w
+            for i, w in enumerate(self._weights.tolist())
+        }
+
+    def _set_ds(self, ds):
+        """Store the hyperedges of ``ds`` in the flat (nodes, offsets, weights)
+        layout."""
+        sizes = [len(edge) for edge in ds]
+        self._edges_ptr = np.zeros(len(ds) + 1, dtype=np.int32)
+        np.cumsum(sizes, out=self._edges_ptr[1:])
+        self._edges_flat = np.fromiter(
+            (node for edge in ds for node in edge),
+            dtype=np.int32,
+            count=self._edges_ptr[-1],
+        )
+        self._weights = np.fromiter(ds.values(), dtype=np.float64, count=len(ds))
+        self._edge_sizes = np.diff(self._edges_ptr)
+
     @property
     def num_nodes(self):
         return self._num_nodes
+
     @property
     def nodes(self):
+        """The set of node labels.
+
+        The labels are mirrored in an int array (``self._nodes_arr``) for
+        matrix construction; both are updated together when uniformization
+        pads with an auxiliary node.
+        """
         return self._nodes
-    
+
     def uniformize(self, m = None):
         N = self._num_nodes
+        sizes = self._edge_sizes
+        max_size = int(sizes.max()) if len(sizes) else 0
         if not m:
-            m = max([len(ind) for ind in list(self._ds.keys())])
+            m = max_size
         else:
             assert isinstance(m, int)
-        if len(set(self._ds.keys())) != 1 or m <= max([len(ind) for ind in list(self._ds.keys())]):
+        if len(self._weights) != 1 or m <= max_size:
             N+=1
-        new_ds = dict()
-        for hyperedge in self._ds:
-            initial_len = len(hyperedge)
-            edge = list(hyperedge)
-    
-            if len(edge) <= m:
-                while len(edge) < m:
-                    edge.append(N - 1)
-                    if not N - 1 in self._nodes:
-                        self._nodes.add(N - 1)
-                        self._num_nodes += 1
-                entry = np.math.factorial(initial_len)/np.math.factorial(len(edge))
-                if tuple(edge) in new_ds:
-                    new_ds[tuple(edge)] += entry
-                else:
-                    new_ds[tuple(edge)] = entry
+        new_ds, padded = _uniformize_ds(self._edges_flat, self._edges_ptr, m, N - 1)
+        if padded and N - 1 not in self._nodes:
+            self._nodes.add(N - 1)
+            self._nodes_arr = np.append(self._nodes_arr, np.int32(N - 1))
+            self._num_nodes += 1
+        self._set_ds(new_ds)
+
+
+def _uniformize_ds(edges_flat, edges_ptr, m, pad_node):
+    """Accumulate the m-uniform decomposition of the given hyperedges.
+
+    Free function on flat typed arrays and ints (no attribute access in the
+    hot loop) so the whole accumulation can later be compiled as-is.
+
+    Parameters
+    ----------
+    edges_flat : numpy.ndarray
+        Concatenated member nodes of all hyperedges.
+    edges_ptr : numpy.ndarray
+        Offsets into ``edges_flat``; hyperedge i spans
+        ``edges_flat[edges_ptr[i]:edges_ptr[i + 1]]``.
+    m : int
+        Target uniformity.
+    pad_node : node
+        Auxiliary node used to pad hyperedges shorter than ``m``.
+
+    Returns
+    -------
+    new_ds : dict
+        The m-uniform hyperedges and their accumulated entries.
+    padded : bool
+        Whether ``pad_node`` was used to pad at least one hyperedge.
+
+    """
+    # factorials are reused on every hyperedge; tabulate them once instead
+    # of calling math.factorial in the loop
+    sizes = np.diff(edges_ptr)
+    max_len = int(sizes.max()) if len(sizes) else 0
+    fact = np.empty(max(max_len, m) + 1)
+    fact[0] = 1
+    for i in range(1, len(fact)):
+        fact[i] = fact[i - 1] * i
+
+    new_ds = defaultdict(float)
+    padded = False
+    for i in range(len(edges_ptr) - 1):
+        hyperedge = edges_flat[edges_ptr[i] : edges_ptr[i + 1]].tolist()
+        # canonical sorted order: equivalent multisets accumulate into the
+        # same key, and pad_node (the largest label) keeps the order when
+        # appended
+        hyperedge.sort()
+        initial_len = len(hyperedge)
+        if initial_len <= m:
+            if initial_len < m:
+                padded = True
+                edge = tuple(hyperedge) + (pad_node,) * (m - initial_len)
             else:
-                indcomb = combinations(edge, m)
-                entry = 1/(np.math.factorial(m)*math.comb(len(edge), m))
-                for indtuple in indcomb:
-                    if indtuple in new_ds:
-                        new_ds[indtuple] += entry
-                    else:
-                        new_ds[indtuple] = entry
-        self._ds = new_ds
-        
-                
\ No newline at end of file
+                edge = tuple(hyperedge)
+            entry = fact[initial_len] / fact[m]
+            new_ds[edge] += entry
+        else:
+            n_comb = math.comb(initial_len, m)
+            entry = 1 / (fact[m] * n_comb)
+            # materialize the C(k, m) combinations as one contiguous
+            # (n_comb, m) array and aggregate repeated rows before touching
+            # the dict, so each hyperedge costs one pass over an int array
+            # plus one dict update per distinct combination
+            indcomb = np.fromiter(
+                combinations(hyperedge, m), dtype=np.dtype((np.int64, m)), count=n_comb
+            )
+            indcomb, counts = np.unique(indcomb, axis=0, return_counts=True)
+            for row, count in zip(indcomb.tolist(), counts.tolist()):
+                new_ds[tuple(row)] += entry * count
+    return new_ds, padded
\ No newline at end of file
@@ -22,7 +22,7 @@ array([[1, 0, 0],
        [0, 1, 0],
        [0, 0, 1],
        [0, 0, 1],
-       [1, 0, 1]])
+       [1, 0, 1]], dtype=int8)
 >>> # Indexing a Pandas dataframe by the node/edge IDs
 >>> df = pd.DataFrame(I, index=nodedict.values(), columns=edgedict.values())
 
@@ -40,7 +40,7 @@ array([[1, 0, 0],
        [0, 1, 0],
        [0, 0, 1],
        [0, 0, 1],
-       [1, 0, 1]])
+       [1, 0, 1]], dtype=int8)
 
 """
 import numpy as np
@@ -22,7 +22,7 @@ array([[1, 0, 0],
        [0, 1, 0],
        [0, 0, 1],
        [0, 0, 1],
-       [1, 0, 1]])
+       [1, 0, 1]], dtype=int8)
 >>> # Indexing a Pandas dataframe by the node/edge IDs
 >>> df = pd.DataFrame(I, index=nodedict.values(), columns=edgedict.values())
 
@@ -40,13 +40,11 @@ array([[1, 0, 0],
        [0, 1, 0],
        [0, 0, 1],
        [0, 0, 1],
-       [1, 0, 1]])
+       [1, 0, 1]], dtype=int8)
 
 """
-from warnings import catch_warnings, warn
-
 import numpy as np
-from scipy.sparse import csr_array
+from scipy.sparse import csc_array, csr_array, triu
 
 __all__ = [
     "incidence_matrix",
@@ -57,8 +55,33 @@ __all__ = [
 ]
 
 
+def _unit_weight(node, edge, H):
+    """Default incidence weight: every membership counts 1."""
+    return 1
+
+
+def _upcast_for_counts(I, bound):
+    """Upcast an int8 incidence matrix when products of it hold counts that
+    can reach ``bound``, so they cannot overflow the narrow dtype."""
+    if I.dtype == np.int8 and bound > np.iinfo(np.int8).max:
+        target = np.int16 if bound <= np.iinfo(np.int16).max else np.int32
+        I = I.astype(target)
+    return I
+
+
+def _zero_diagonal(A):
+    """Zero the stored diagonal entries of a square CSR matrix in place.
+
+    Unlike ``setdiag(0)``, this never inserts entries or reallocates the
+    CSR structure: diagonal entries that are already implicit stay so.
+    """
+    diag = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+    A.data[A.indices == diag] = 0
+    A.eliminate_zeros()
+
+
 def incidence_matrix(
-    H, order=None, sparse=True, index=False, weight=lambda node, edge, H: 1
+    H, order=None, sparse=True, index=False, weight=_unit_weight, vectorized_weight=None
 ):
     """A function to generate a weighted incidence matrix from a Hypergraph object,
     where the rows correspond to nodes and the columns correspond to edges.
@@ -76,7 +99,15 @@ def incidence_matrix(
         Specifies whether to output dictionaries mapping the node and edge IDs to
         indices.
     weight: lambda function, default=lambda function outputting 1
-        A function specifying the weight, given a node and edge
+        A function specifying the weight, given a node and edge. When left
+        at the default, the matrix data is stored as int8 to halve the
+        memory traffic of downstream products.
+    vectorized_weight: function, optional
+        If given, takes precedence over ``weight``: it is called once with
+        the flattened array of node IDs, the matching array of edge IDs
+        (one entry per incidence) and ``H``, and must return the array of
+        weights for those entries. Like ``weight``, the values are stored
+        as integers.
 
     Returns
     -------
@@ -92,7 +123,17 @@ def incidence_matrix(
     edge_ids = H.edges
 
     if order is not None:
-        edge_ids = H.edges.filterby("order", order)
+        # Filter by size with a single vectorized comparison over the edge
+        # dict; going through edges.filterby would build a full EdgeStat
+        # view for one comparison per edge. The result is materialized once
+        # since it is traversed several times below.
+        edge_sizes = np.fromiter(
+            (len(edge) for edge in H._edge.values()),
+            dtype=np.int64,
+            count=H.num_edges,
+        )
+        mask = edge_sizes == order + 1
+        edge_ids = [id_ for id_, keep in zip(H._edge, mask.tolist()) if keep]
     if not edge_ids or not node_ids:
         if sparse:
             I = csr_array((0, 0), dtype=int)
@@ -110,23 +151,42 @@ def incidence_matrix(
         rowdict = {v: k for k, v in node_dict.items()}
         coldict = {v: k for k, v in edge_dict.items()}
 
-    # Compute the non-zero values, row and column indices for the given order
-    rows = []
-    cols = []
-    data = []
-    for edge in edge_ids:
-        members = H._edge[edge]
-        for node in members:
-            rows.append(node_dict[node])
-            cols.append(edge_dict[edge])
-            data.append(weight(node, edge, H))
-
-    # Create the incidence matrix as a CSR matrix
-    if sparse:
-        I = csr_array((data, (rows, cols)), shape=(num_nodes, num_edges), dtype=int)
+    # Compute the non-zero values and their positions for the given order.
+    # Iterating edge-by-edge emits the entries of each column contiguously,
+    # so the compressed-sparse structure (data, indices, indptr) can be built
+    # directly without going through COO triplets and their sort/dedup pass.
+    sizes = np.fromiter(
+        (len(H._edge[edge]) for edge in edge_ids), dtype=np.int32, count=num_edges
+    )
+    indptr = np.zeros(num_edges + 1, dtype=np.int32)
+    np.cumsum(sizes, out=indptr[1:])
+    rows = np.empty(indptr[-1], dtype=np.int32)
+    # for the default unit weight the data is all ones and never needs a
+    # Python call per entry; int8 keeps the downstream products narrow
+    unit = weight is _unit_weight and vectorized_weight is None
+    if unit:
+        data = np.ones(indptr[-1], dtype=np.int8)
+    elif vectorized_weight is not None:
+        # one bulk call over the flattened incidence pairs instead of one
+        # Python call per nonzero
+        entry_nodes = np.asarray([node for edge in edge_ids for node in H._edge[edge]])
+        entry_edges = np.repeat(np.asarray(edge_ids), sizes)
+        data = np.asarray(vectorized_weight(entry_nodes, entry_edges, H), dtype=int)
     else:
-        I = np.zeros((num_nodes, num_edges), dtype=int)
-        I[rows, cols] = data
+        data = np.empty(indptr[-1], dtype=int)
+    for i, edge in enumerate(edge_ids):
+        members = H._edge[edge]
+        entries = slice(indptr[i], indptr[i + 1])
+        rows[entries] = [node_dict[node] for node in members]
+        if not unit and vectorized_weight is None:
+            data[entries] = [weight(node, edge, H) for node in members]
+
+    # Create the incidence matrix as a CSR matrix; the dense result is
+    # recovered from it rather than scattered into a separately allocated
+    # (num_nodes, num_edges) array
+    I = csc_array((data, rows, indptr), shape=(num_nodes, num_edges)).tocsr()
+    if not sparse:
+        I = I.toarray()
 
     return (I, rowdict, coldict) if index else I
 
@@ -160,11 +220,6 @@ def adjacency_matrix(H, order=None, sparse=True, s=1, weighted=False, index=Fals
     else:
         return A
 
-    Warns
-    -----
-    warn
-        If there are isolated nodes and the matrix is sparse.
-
     """
     I, rowdict, coldict = incidence_matrix(H, order=order, sparse=sparse, index=True)
 
@@ -176,26 +231,28 @@ def adjacency_matrix(H, order=None, sparse=True, s=1, weighted=False, index=Fals
             A = csr_array(shape, dtype=int) if sparse else np.zeros(shape, dtype=int)
         return (A, {}) if index else A
 
+    # entries of I I^T count shared edges, bounded by the number of edges
+    I = _upcast_for_counts(I, I.shape[1])
     A = I.dot(I.T)
 
     if sparse:
-        with catch_warnings(record=True) as w:
-            A.setdiag(0)
-        if w:
-            warn(
-                "Forming the adjacency matrix can "
-                "be expensive when there are isolated nodes!"
-            )
+        _zero_diagonal(A)
     else:
         np.fill_diagonal(A, 0)
 
-    if not weighted:
-        A = (A >= s) * 1
-    else:
-        A = (A >= s) * A
-
     if sparse:
+        # threshold the stored entries in place; comparing the whole matrix
+        # would allocate an intermediate for every implicit zero as well
+        if not weighted:
+            A.data = (A.data >= s).astype(A.dtype)
+        else:
+            A.data[A.data < s] = 0
         A.eliminate_zeros()
+    else:
+        if not weighted:
+            A = (A >= s) * 1
+        else:
+            A = (A >= s) * A
 
     return (A, rowdict) if index else A
 
@@ -223,9 +280,19 @@ def intersection_profile(H, order=None, sparse=True, index=False):
     else:
         return P
 
+    Notes
+    -----
+    When sparse, the profile is returned as a csc_array: it is the natural
+    layout of the ``I^T I`` product and keeps the per-edge column slicing
+    done by downstream consumers on the fast path.
+
     """
     eye, _, coldict = incidence_matrix(H, order=order, sparse=sparse, index=True)
+    # entries of I^T I count shared nodes, bounded by the number of nodes
+    eye = _upcast_for_counts(eye, eye.shape[0])
     P = eye.T.dot(eye)
+    if sparse:
+        P = csc_array(P)
     return (P, coldict) if index else P
 
 
@@ -290,6 +357,26 @@ def clique_motif_matrix(H, sparse=True, index=False):
     https://doi.org/10.1126/science.aad9029
 
     """
-    W, rowdict = adjacency_matrix(H, sparse=sparse, weighted=True, index=True)
+    I, rowdict, coldict = incidence_matrix(H, sparse=sparse, index=True)
+
+    if I.shape == (0, 0):
+        if not rowdict:
+            W = csr_array((0, 0)) if sparse else np.empty((0, 0))
+        if not coldict:
+            shape = (H.num_nodes, H.num_nodes)
+            W = csr_array(shape, dtype=int) if sparse else np.zeros(shape, dtype=int)
+        return (W, rowdict) if index else W
+
+    I = _upcast_for_counts(I, I.shape[1])
+    W = I.dot(I.T)
+
+    if sparse:
+        # the product is symmetric, so mirroring its strict upper triangle
+        # reconstructs it while dropping the diagonal without a structural
+        # setdiag pass
+        W = triu(W, k=1, format="csr")
+        W = W + W.T
+    else:
+        np.fill_diagonal(W, 0)
 
     return (W, rowdict) if index else W
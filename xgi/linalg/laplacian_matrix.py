@@ -22,7 +22,7 @@ array([[1, 0, 0],
        [0, 1, 0],
        [0, 0, 1],
        [0, 0, 1],
-       [1, 0, 1]])
+       [1, 0, 1]], dtype=int8)
 >>> # Indexing a Pandas dataframe by the node/edge IDs
 >>> df = pd.DataFrame(I, index=nodedict.values(), columns=edgedict.values())
 
@@ -40,7 +40,7 @@ array([[1, 0, 0],
        [0, 1, 0],
        [0, 0, 1],
        [0, 0, 1],
-       [1, 0, 1]])
+       [1, 0, 1]], dtype=int8)
 
 """
 from warnings import warn
@@ -49,7 +49,13 @@ import numpy as np
 from scipy.sparse import csr_array, diags
 
 from ..exception import XGIError
-from .hypergraph_matrix import adjacency_matrix, clique_motif_matrix, degree_matrix
+from .hypergraph_matrix import (
+    _upcast_for_counts,
+    _zero_diagonal,
+    clique_motif_matrix,
+    degree_matrix,
+    incidence_matrix,
+)
 
 __all__ = [
     "laplacian",
@@ -92,18 +98,33 @@ def laplacian(H, order=1, sparse=False, rescale_per_node=False, index=False):
         Physical Review Research, 2(3), 033410.
 
     """
-    A, row_dict = adjacency_matrix(
-        H, order=order, sparse=sparse, weighted=True, index=True
-    )
+    # Both the weighted adjacency matrix and the degree vector derive from
+    # the same incidence matrix, so build it once instead of once per factor.
+    I, row_dict, _ = incidence_matrix(H, order=order, sparse=sparse, index=True)
 
-    if A.shape == (0, 0):
-        L = csr_array((0, 0)) if sparse else np.empty((0, 0))
+    if I.shape == (0, 0):
+        if H.num_nodes == 0:
+            L = csr_array((0, 0)) if sparse else np.empty((0, 0))
+        else:
+            shape = (H.num_nodes, H.num_nodes)
+            L = csr_array(shape) if sparse else np.zeros(shape)
         return (L, {}) if index else L
 
+    # entries of I I^T count shared edges, bounded by the number of edges
+    I = _upcast_for_counts(I, I.shape[1])
+    A = I.dot(I.T)
+
+    if sparse:
+        _zero_diagonal(A)
+    else:
+        np.fill_diagonal(A, 0)
+
+    K = np.ravel(I.sum(axis=1))  # flatten
+
     if sparse:
-        K = csr_array(diags(degree_matrix(H, order=order)))
+        K = csr_array(diags(K))
     else:
-        K = np.diag(degree_matrix(H, order=order))
+        K = np.diag(K)
 
     L = order * K - A  # ravel needed to convert sparse matrix
 
@@ -225,8 +246,7 @@ def normalized_hypergraph_laplacian(H, sparse=True, index=False):
 
     if sparse:
         Dinvsqrt = csr_array(diags(np.power(D, -0.5)))
-        eye = csr_array((H.num_nodes, H.num_nodes))
-        eye.setdiag(1)
+        eye = csr_array(diags(np.ones(H.num_nodes)))
     else:
         Dinvsqrt = np.diag(np.power(D, -0.5))
         eye = np.eye(H.num_nodes)